@@ -2,34 +2,138 @@
 # ABOUTME: Scrapes article text and generates audio podcast version
 
 import argparse
+import asyncio
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from email.message import Message
 from pathlib import Path
+from typing import Optional
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from lxml import etree
 import pyttsx3
 
+try:
+    import edge_tts
+except ImportError:
+    edge_tts = None
 
-def article_to_audio(url: str, output_file: str = "article.mp3") -> None:
+# Shared session so repeated fetches reuse pooled keep-alive connections.
+# Advertise every encoding urllib3 can decode here (br once brotli is
+# installed) so pages arrive compressed. lxml gets the raw decoded bytes plus
+# the Content-Type charset (see header_charset), so requests never builds
+# response.text
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=10))
+_SESSION.headers.update({
+    "User-Agent": "Mozilla/5.0 (compatible; articles-pod/1.0)",
+    "Accept-Encoding": ACCEPT_ENCODING,
+})
+
+CHUNK_SIZE = 64 * 1024
+
+# pyttsx3 engine, initialized on first use and reused across calls
+_engine = None
+
+
+def get_engine() -> pyttsx3.Engine:
+    """Return the shared pyttsx3 engine, initializing it once."""
+    global _engine
+    if _engine is None:
+        _engine = pyttsx3.init()
+    return _engine
+
+
+async def stream_edge_tts(text: str, voice: str, output_file: str) -> None:
+    """Write edge-tts audio chunks to disk as they are synthesized."""
+    communicate = edge_tts.Communicate(text, voice)
+    with open(output_file, "wb") as f:
+        async for chunk in communicate.stream():
+            if chunk["type"] == "audio":
+                f.write(chunk["data"])
+
+
+def header_charset(content_type: Optional[str]) -> Optional[str]:
+    """
+    Return the charset declared in a Content-Type header, if any.
+
+    Unlike response.encoding, this is None when the header names no charset
+    (requests would assume ISO-8859-1), leaving lxml to use <meta charset>.
+    """
+    if not content_type:
+        return None
+    message = Message()
+    message["Content-Type"] = content_type
+    return message.get_content_charset()
+
+
+def run_coroutine(coro) -> None:
+    """
+    Run a coroutine to completion from synchronous code.
+
+    asyncio.run() refuses to start when this thread already has a running
+    event loop (as some hosting apps do), so in that case the coroutine
+    gets its own loop on a worker thread instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(coro)
+        return
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pool.submit(asyncio.run, coro).result()
+
+
+def article_to_audio(
+    url: str,
+    output_file: str = "article.mp3",
+    voice: Optional[str] = None
+) -> None:
     """
     Convert web article to audio file.
 
     Args:
         url: Article URL to convert
         output_file: Output MP3 filename
+        voice: edge-tts voice to stream synthesis with (uses pyttsx3 if not set)
     """
+    if voice and edge_tts is None:
+        print("[ERROR] Streaming voices require edge-tts")
+        print("[INFO] Install with: pip install edge-tts")
+        sys.exit(1)
+
     try:
         print(f"[INFO] Fetching article from {url}")
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
+        # Feed the body to lxml as it arrives so parsing overlaps the download
+        # and the full page is never held as bytes and str at once
+        with _SESSION.get(url, stream=True, timeout=(5, 30)) as response:
+            response.raise_for_status()
+
+            # Raw bytes carry no encoding, so pass on the one the server
+            # declared; without it lxml falls back to <meta> or Latin-1
+            encoding = header_charset(response.headers.get("Content-Type"))
+            try:
+                parser = etree.HTMLParser(encoding=encoding)
+            except LookupError:
+                parser = etree.HTMLParser()
+
+            for chunk in response.iter_content(CHUNK_SIZE):
+                parser.feed(chunk)
+
+        try:
+            root = parser.close()
+        except etree.XMLSyntaxError:
+            root = None
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        paragraphs = soup.find_all("p")
+        paragraphs = list(root.iter("p")) if root is not None else []
 
         if not paragraphs:
             print("[ERROR] No paragraphs found in article")
             sys.exit(1)
 
-        text = " ".join([p.text.strip() for p in paragraphs])
+        text = " ".join("".join(p.itertext()).strip() for p in paragraphs)
 
         if not text:
             print("[ERROR] No text extracted from article")
@@ -38,9 +142,12 @@ def article_to_audio(url: str, output_file: str = "article.mp3") -> None:
         print(f"[INFO] Extracted {len(text)} characters")
         print("[INFO] Generating audio file...")
 
-        engine = pyttsx3.init()
-        engine.save_to_file(text, output_file)
-        engine.runAndWait()
+        if voice:
+            run_coroutine(stream_edge_tts(text, voice, output_file))
+        else:
+            engine = get_engine()
+            engine.save_to_file(text, output_file)
+            engine.runAndWait()
 
         if Path(output_file).exists():
             print(f"[OK] Audio saved to {output_file}")
@@ -66,9 +173,13 @@ def main() -> None:
         default="article.mp3",
         help="Output MP3 filename (default: article.mp3)"
     )
+    parser.add_argument(
+        "-v", "--voice",
+        help="Stream synthesis with an edge-tts voice (e.g., en-US-AriaNeural)"
+    )
 
     args = parser.parse_args()
-    article_to_audio(args.url, args.output)
+    article_to_audio(args.url, args.output, args.voice)
 
 
 if __name__ == "__main__":
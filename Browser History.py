@@ -10,6 +10,25 @@ from pathlib import Path
 from typing import List, Tuple
 
 
+def _query_history(uri: str, limit: int) -> List[Tuple[str, str, int]]:
+    """Run the history query against a SQLite URI."""
+    conn = sqlite3.connect(uri, uri=True)
+    try:
+        cursor = conn.cursor()
+        # The DB is read-only here, so no index on last_visit_time can be
+        # added; give the sorter a 20 MB page cache and memory-map the file
+        cursor.execute("PRAGMA cache_size = -20000")
+        cursor.execute("PRAGMA mmap_size = 268435456")
+        cursor.execute(
+            "SELECT url, title, last_visit_time FROM urls "
+            "ORDER BY last_visit_time DESC LIMIT ?",
+            (limit,)
+        )
+        return cursor.fetchall()
+    finally:
+        conn.close()
+
+
 def get_chrome_history(db_path: str, limit: int = 50) -> List[Tuple[str, str, int]]:
     """
     Extract Chrome browsing history.
@@ -21,36 +40,19 @@ def get_chrome_history(db_path: str, limit: int = 50) -> List[Tuple[str, str, in
     Returns:
         List of (url, title, timestamp) tuples
     """
-    import shutil
-    import tempfile
-
     try:
         if not Path(db_path).exists():
             print(f"[ERROR] History database not found: {db_path}")
             sys.exit(1)
 
-        # Copy DB to temp file to avoid lock (Chrome keeps it open)
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".db") as tmp:
-            temp_db = tmp.name
-
+        # Read the DB in place instead of copying it. immutable=1 skips
+        # locking so a running Chrome doesn't block us; if the file can't be
+        # read that way (e.g. mid-write), retry in plain read-only mode
+        uri = Path(db_path).resolve().as_uri()
         try:
-            shutil.copy2(db_path, temp_db)
-
-            conn = sqlite3.connect(temp_db)
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT url, title, last_visit_time FROM urls "
-                "ORDER BY last_visit_time DESC LIMIT ?",
-                (limit,)
-            )
-            rows = cursor.fetchall()
-            conn.close()
-            return rows
-
-        finally:
-            # Clean up temp file
-            if Path(temp_db).exists():
-                os.unlink(temp_db)
+            return _query_history(f"{uri}?mode=ro&immutable=1", limit)
+        except sqlite3.DatabaseError:
+            return _query_history(f"{uri}?mode=ro", limit)
 
     except sqlite3.Error as e:
         print(f"[ERROR] Database error: {e}")
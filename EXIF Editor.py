@@ -2,35 +2,205 @@
 # ABOUTME: Supports batch operations and privacy-focused metadata stripping
 
 import argparse
+import mmap
+import os
+import pickle
+import struct
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Dict, Optional
-from PIL import Image
+from typing import Any, Dict, Optional, Tuple
+from PIL import Image, ImageOps, PngImagePlugin
 from PIL.ExifTags import TAGS, GPSTAGS
+from PIL.TiffImagePlugin import IFDRational
 import piexif
 
+# Numeric tag IDs of the fields shown by default, in display order
+KEY_FIELD_IDS = {
+    306: "DateTime",
+    36867: "DateTimeOriginal",
+    271: "Make",
+    272: "Model",
+    42036: "LensModel",
+    33437: "FNumber",
+    33434: "ExposureTime",
+    34855: "ISOSpeedRatings",
+    37386: "FocalLength",
+    37385: "Flash",
+    41987: "WhiteBalance",
+    34853: "GPSInfo",
+}
+
+
+def _convert_exif_value(ifd: str, tag_id: int, value: Any) -> Any:
+    """Convert a piexif value to the type PIL's _getexif() returns."""
+    tag_type = piexif.TAGS[ifd].get(tag_id, {}).get("type")
+
+    if tag_type == piexif.TYPES.Ascii and isinstance(value, bytes):
+        return value.rstrip(b"\0").decode("latin-1", "replace")
+    if tag_type == piexif.TYPES.Byte:
+        # piexif unpacks BYTE arrays to ints; PIL keeps them as bytes
+        if isinstance(value, tuple):
+            return bytes(value)
+        if isinstance(value, int):
+            return bytes((value,))
+        return value
+    if tag_type in (piexif.TYPES.Rational, piexif.TYPES.SRational):
+        if value and isinstance(value[0], tuple):
+            return tuple(IFDRational(num, den) for num, den in value)
+        return IFDRational(*value)
+    return value
+
+
+def _read_jpeg_exif(image_file: str) -> Optional[Dict]:
+    """
+    Read EXIF tags from a JPEG without decoding it.
+
+    The file is memory-mapped and only the marker headers up to the APP1
+    segment are touched, so large images cost a few pages of I/O.
+
+    Args:
+        image_file: JPEG file path
+
+    Returns:
+        Dict keyed by tag ID like PIL's _getexif() ({} if there is no EXIF),
+        or None if the file isn't a JPEG
+    """
+    with open(image_file, "rb") as f:
+        if os.fstat(f.fileno()).st_size < 4:
+            return None
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:2] != b"\xff\xd8":
+                return None
+
+            # Walk segment headers until APP1/Exif or the image data starts
+            payload = None
+            pos = 2
+            while pos + 4 <= len(mm) and mm[pos] == 0xFF:
+                marker = mm[pos + 1]
+                if marker in (0xD9, 0xDA):  # EOI / start of scan
+                    break
+                length = struct.unpack(">H", mm[pos + 2:pos + 4])[0]
+                if marker == 0xE1 and mm[pos + 4:pos + 10] == b"Exif\0\0":
+                    payload = mm[pos + 4:pos + 2 + length]
+                    break
+                pos += 2 + length
+
+    if payload is None:
+        return {}
+
+    exif_dict = piexif.load(payload)
+
+    # Flatten like PIL: 0th + Exif IFD tags, with GPS nested under GPSInfo
+    exif_data = {}
+    for ifd in ("0th", "Exif"):
+        for tag_id, value in exif_dict[ifd].items():
+            exif_data[tag_id] = _convert_exif_value(ifd, tag_id, value)
+
+    if exif_dict["GPS"]:
+        exif_data[piexif.ImageIFD.GPSTag] = {
+            tag_id: _convert_exif_value("GPS", tag_id, value)
+            for tag_id, value in exif_dict["GPS"].items()
+        }
+
+    return exif_data
+
+
+def _strip_jpeg_segments(data: bytes) -> bytes:
+    """
+    Drop metadata segments from JPEG bytes without re-encoding.
 
-def read_exif(image_file: str) -> Dict:
+    Removes APP1-APP15 (EXIF, XMP, IPTC/APP13, ...) and COM comments. The
+    ICC profile (APP2) and Adobe color transform (APP14) are kept, since
+    they change how the pixels are decoded.
+
+    Args:
+        data: JPEG file contents
+
+    Returns:
+        JPEG bytes with metadata segments removed
+    """
+    if data[:2] != b"\xff\xd8":
+        raise ValueError("Not a JPEG file")
+
+    parts = [data[:2]]
+    pos = 2
+    while pos + 4 <= len(data):
+        if data[pos] != 0xFF:
+            raise ValueError("Corrupt JPEG marker")
+        marker = data[pos + 1]
+        if marker == 0xFF:  # fill byte
+            pos += 1
+            continue
+        if marker in (0xD9, 0xDA):  # EOI / start of scan: copy the rest
+            break
+
+        length = struct.unpack(">H", data[pos + 2:pos + 4])[0]
+        segment = data[pos:pos + 2 + length]
+        body = segment[4:]
+
+        keep = True
+        if marker == 0xFE:  # COM
+            keep = False
+        elif 0xE1 <= marker <= 0xEF:
+            keep = (
+                (marker == 0xE2 and body.startswith(b"ICC_PROFILE\0"))
+                or (marker == 0xEE and body.startswith(b"Adobe"))
+            )
+
+        if keep:
+            parts.append(segment)
+        pos += 2 + length
+
+    parts.append(data[pos:])
+    return b"".join(parts)
+
+
+def read_exif(image_file: str, key_fields_only: bool = False) -> Dict:
     """
     Read EXIF data from image.
 
     Args:
         image_file: Image file path
+        key_fields_only: Only decode the fields in KEY_FIELD_IDS
 
     Returns:
         Dictionary of EXIF data
     """
     try:
-        img = Image.open(image_file)
-        exif_data = img._getexif()
+        # JPEG EXIF is read straight from the APP1 segment; anything else
+        # (or a JPEG piexif can't parse) goes through PIL
+        exif_data = None
+        if Path(image_file).suffix.lower() in (".jpg", ".jpeg"):
+            try:
+                exif_data = _read_jpeg_exif(image_file)
+            except (ValueError, struct.error, piexif.InvalidImageDataError):
+                exif_data = None
+
+        if exif_data is None:
+            img = Image.open(image_file)
+            exif_data = img._getexif()
 
         if not exif_data:
             return {}
 
-        decoded = {}
-        for tag_id, value in exif_data.items():
-            tag = TAGS.get(tag_id, tag_id)
+        # Fetch wanted fields by ID rather than name-decoding every tag
+        if key_fields_only:
+            tags = (
+                (name, exif_data[tag_id])
+                for tag_id, name in KEY_FIELD_IDS.items()
+                if tag_id in exif_data
+            )
+        else:
+            tags = (
+                (TAGS.get(tag_id, tag_id), value)
+                for tag_id, value in exif_data.items()
+            )
 
+        decoded = {}
+        for tag, value in tags:
             # Handle GPS data specially
             if tag == "GPSInfo":
                 gps_data = {}
@@ -64,11 +234,7 @@ def display_exif(exif_data: Dict, verbose: bool = False) -> None:
         return
 
     # Key fields to show by default
-    key_fields = [
-        "DateTime", "DateTimeOriginal", "Make", "Model",
-        "LensModel", "FNumber", "ExposureTime", "ISOSpeedRatings",
-        "FocalLength", "Flash", "WhiteBalance", "GPSInfo"
-    ]
+    key_fields = list(KEY_FIELD_IDS.values())
 
     print("\n[INFO] EXIF Data:")
     print("-" * 50)
@@ -104,9 +270,41 @@ def strip_exif(
         keep_orientation: Preserve image orientation
     """
     try:
+        output = output_file or image_file
+        suffix = Path(image_file).suffix.lower()
+
+        if suffix in (".jpg", ".jpeg"):
+            # Cut the metadata segments out of the file; pixel data and
+            # quantization tables are copied untouched (no re-encode)
+            orientation = None
+            if keep_orientation:
+                orientation = piexif.load(image_file)["0th"].get(piexif.ImageIFD.Orientation)
+
+            stripped = _strip_jpeg_segments(Path(image_file).read_bytes())
+            Path(output).write_bytes(stripped)
+
+            # Keep only the Orientation tag so viewers still rotate it
+            if orientation and orientation != 1:
+                exif_bytes = piexif.dump({"0th": {piexif.ImageIFD.Orientation: orientation}})
+                piexif.insert(exif_bytes, output)
+
+            print(f"[OK] EXIF data stripped from {output}")
+            return
+
         img = Image.open(image_file)
 
-        # Save orientation if needed
+        if suffix == ".png":
+            # PNG is lossless, so apply orientation to the pixels and write
+            # no text/EXIF chunks
+            if keep_orientation:
+                img = ImageOps.exif_transpose(img)
+            img.save(output, pnginfo=PngImagePlugin.PngInfo())
+
+            print(f"[OK] EXIF data stripped from {output}")
+            return
+
+        # Other formats are rebuilt from raw pixel data; save orientation
+        # first if needed
         if keep_orientation and hasattr(img, '_getexif'):
             exif = img._getexif()
             orientation = exif.get(274) if exif else None  # 274 = Orientation tag
@@ -127,7 +325,6 @@ def strip_exif(
             elif orientation == 8:
                 image_no_exif = image_no_exif.rotate(90, expand=True)
 
-        output = output_file or image_file
         image_no_exif.save(output)
 
         print(f"[OK] EXIF data stripped from {output}")
@@ -137,6 +334,11 @@ def strip_exif(
         sys.exit(1)
 
 
+def _strip_one(job: Tuple[str, str, bool]) -> None:
+    """Strip a single (input, output, keep_orientation) job in a worker."""
+    strip_exif(*job)
+
+
 def batch_strip(
     directory: str,
     output_dir: str = None,
@@ -164,6 +366,7 @@ def batch_strip(
 
     print(f"[INFO] Found {len(images)} images")
 
+    jobs = []
     for img_path in images:
         if output_dir:
             output_path = Path(output_dir) / img_path.name
@@ -171,7 +374,23 @@ def batch_strip(
         else:
             output_path = img_path
 
-        strip_exif(str(img_path), str(output_path), keep_orientation)
+        jobs.append((str(img_path), str(output_path), keep_orientation))
+
+    # Image codec work is CPU-bound, so spread larger batches across cores.
+    # Workers import this module by name, which fails when it was loaded
+    # from a file path (as app.py does); strip serially then
+    use_pool = len(jobs) >= 4
+    if use_pool:
+        chunksize = max(1, len(jobs) // (4 * (os.cpu_count() or 1)))
+        try:
+            with ProcessPoolExecutor() as executor:
+                list(executor.map(_strip_one, jobs, chunksize=chunksize))
+        except (pickle.PicklingError, BrokenProcessPool):
+            use_pool = False
+
+    if not use_pool:
+        for job in jobs:
+            _strip_one(job)
 
     print(f"[OK] Processed {len(images)} images")
 
@@ -224,7 +443,7 @@ def main() -> None:
         sys.exit(1)
 
     if args.command == "view":
-        exif_data = read_exif(args.image)
+        exif_data = read_exif(args.image, key_fields_only=not args.verbose)
         display_exif(exif_data, args.verbose)
     elif args.command == "strip":
         strip_exif(args.image, args.output, not args.no_orientation)
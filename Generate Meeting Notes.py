@@ -1,20 +1,160 @@
 # ABOUTME: Records audio from microphone and transcribes to text file
-# ABOUTME: Generates meeting notes from voice recording using Google Speech API
+# ABOUTME: Generates meeting notes from voice recording using Google Speech API or local Whisper
 
 import argparse
+import queue
 import sys
+import time
 from pathlib import Path
+from typing import List
 import speech_recognition as sr
 
+try:
+    import numpy as np
+    import sounddevice as sd
+    from faster_whisper import WhisperModel
+    LOCAL_AVAILABLE = True
+except ImportError:
+    LOCAL_AVAILABLE = False
 
-def record_meeting_notes(output_file: str = "meeting_notes.txt", duration: int = 0) -> None:
+SAMPLE_RATE = 16000
+BLOCK_SECONDS = 0.1
+SILENCE_SECONDS = 0.7
+
+
+def _rms(block: "np.ndarray") -> float:
+    """Root-mean-square level of an audio block."""
+    return float(np.sqrt(np.mean(np.square(block))))
+
+
+def _transcribe(model: "WhisperModel", blocks: List["np.ndarray"]) -> str:
+    """Transcribe one buffered utterance."""
+    segments, _ = model.transcribe(
+        np.concatenate(blocks),
+        beam_size=1,
+        vad_filter=True
+    )
+    return " ".join(segment.text.strip() for segment in segments)
+
+
+def record_local_notes(
+    output_file: str = "meeting_notes.txt",
+    duration: int = 0,
+    model_size: str = "small"
+) -> None:
+    """
+    Record audio and transcribe it locally with faster-whisper.
+
+    Each utterance is transcribed as soon as it ends (after a short silence)
+    while the microphone keeps recording in the background.
+
+    Args:
+        output_file: Output text filename
+        duration: Recording duration in seconds (0 = until silence)
+        model_size: Whisper model size (tiny, base, small, medium, large-v3)
+    """
+    if not LOCAL_AVAILABLE:
+        print("[ERROR] Local transcription not available")
+        print("[INFO] Install with: pip install faster-whisper sounddevice numpy")
+        sys.exit(1)
+
+    try:
+        print(f"[INFO] Loading Whisper model '{model_size}' (int8)...")
+        model = WhisperModel(model_size, compute_type="int8")
+
+        blocks = queue.Queue()
+        block_size = int(SAMPLE_RATE * BLOCK_SECONDS)
+        silence_blocks = int(SILENCE_SECONDS / BLOCK_SECONDS)
+
+        def callback(indata, frames, time_info, status) -> None:
+            blocks.put(indata[:, 0].copy())
+
+        texts = []
+        with sd.InputStream(
+            samplerate=SAMPLE_RATE,
+            channels=1,
+            dtype="float32",
+            blocksize=block_size,
+            callback=callback
+        ), open(output_file, "w", encoding="utf-8") as f:
+            print("[INFO] Adjusting for ambient noise...")
+            ambient = [blocks.get() for _ in range(int(1 / BLOCK_SECONDS))]
+            threshold = max(3 * _rms(np.concatenate(ambient)), 0.01)
+
+            print("[INFO] Listening... (speak now, Ctrl+C to stop)")
+            start = time.monotonic()
+            utterance = []
+            silent = 0
+
+            try:
+                while duration <= 0 or time.monotonic() - start < duration:
+                    block = blocks.get()
+
+                    # Energy gate: buffer speech plus its trailing silence
+                    if _rms(block) > threshold:
+                        utterance.append(block)
+                        silent = 0
+                    elif utterance:
+                        utterance.append(block)
+                        silent += 1
+
+                    if utterance and silent >= silence_blocks:
+                        text = _transcribe(model, utterance)
+                        utterance = []
+                        silent = 0
+
+                        if text:
+                            texts.append(text)
+                            f.write(text + "\n")
+                            f.flush()
+                            print(f"[INFO] Transcribed: {text}")
+
+                        if duration <= 0:
+                            break
+            except KeyboardInterrupt:
+                print("\n[INFO] Recording stopped")
+
+            if utterance:
+                text = _transcribe(model, utterance)
+                if text:
+                    texts.append(text)
+                    f.write(text + "\n")
+
+        if not texts:
+            Path(output_file).unlink(missing_ok=True)
+            print("[WARN] No speech detected")
+            return
+
+        print(f"[OK] Meeting notes saved to {output_file}")
+
+    except OSError as e:
+        print(f"[ERROR] Microphone error: {e}")
+        print("[INFO] Make sure a microphone is connected and accessible")
+        sys.exit(1)
+    except Exception as e:
+        print(f"[ERROR] Unexpected error: {e}")
+        sys.exit(1)
+
+
+def record_meeting_notes(
+    output_file: str = "meeting_notes.txt",
+    duration: int = 0,
+    engine: str = "google",
+    model_size: str = "small"
+) -> None:
     """
     Record audio and transcribe to text file.
 
     Args:
         output_file: Output text filename
         duration: Recording duration in seconds (0 = until silence)
+        engine: Speech engine ('google' or local 'whisper')
+        model_size: Whisper model size when engine is 'whisper'
     """
+    if engine == "whisper":
+        record_local_notes(output_file, duration, model_size)
+        return
+
     recognizer = sr.Recognizer()
 
     try:
@@ -75,9 +215,20 @@ def main() -> None:
         default=0,
         help="Recording duration in seconds (default: 0 = until silence)"
     )
+    parser.add_argument(
+        "-e", "--engine",
+        choices=["google", "whisper"],
+        default="google",
+        help="Speech engine: Google API or local faster-whisper (default: google)"
+    )
+    parser.add_argument(
+        "-m", "--model",
+        default="small",
+        help="Whisper model size for --engine whisper (default: small)"
+    )
 
     args = parser.parse_args()
-    record_meeting_notes(args.output, args.duration)
+    record_meeting_notes(args.output, args.duration, args.engine, args.model)
 
 
 if __name__ == "__main__":
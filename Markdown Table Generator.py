@@ -3,24 +3,77 @@
 
 import argparse
 import csv
+import io
 import json
 import sys
+from itertools import islice, zip_longest
+from operator import itemgetter
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# str methods used to pad data cells for each alignment
+PAD_FUNCTIONS = {"left": str.ljust, "center": str.center, "right": str.rjust}
+
+
+def column_widths(
+    headers: List[str],
+    rows: Iterable[List[str]],
+    batch_size: int = 1024
+) -> List[int]:
+    """
+    Calculate column widths in a single streaming pass.
+
+    Args:
+        headers: Column headers
+        rows: Table data rows (any iterable, consumed once)
+        batch_size: Rows measured per batch
+
+    Returns:
+        Width of each column
+    """
+    widths = [len(h) for h in headers]
+    rows = iter(rows)
+
+    # Measure a batch at a time, a whole column per step
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
+
+        columns = zip_longest(
+            *([str(cell) for cell in row] for row in batch),
+            fillvalue=""
+        )
+        for i, column in enumerate(columns):
+            width = max(map(len, column))
+            if i < len(widths):
+                widths[i] = max(widths[i], width)
+            else:
+                widths.append(width)
+
+    return widths
 
 
 def format_table(
-    data: List[List[str]],
+    data: Iterable[List[str]],
     headers: List[str],
-    alignment: List[str] = None
+    alignment: List[str] = None,
+    widths: List[int] = None
 ) -> str:
     """
     Format data as markdown table.
 
     Args:
-        data: Table data rows
+        data: Table data rows (may be a one-shot iterator if widths is given)
         headers: Column headers
         alignment: List of 'left', 'center', 'right' for each column
+        widths: Precomputed column widths (calculated from data if omitted)
 
     Returns:
         Markdown table string
@@ -28,18 +81,16 @@ def format_table(
     if not alignment:
         alignment = ["left"] * len(headers)
 
-    # Calculate column widths
-    widths = [len(h) for h in headers]
-    for row in data:
-        for i, cell in enumerate(row):
-            widths[i] = max(widths[i], len(str(cell)))
+    if widths is None:
+        data = list(data)
+        widths = column_widths(headers, data)
 
-    # Build table
-    lines = []
+    # Build table into a single buffer
+    buf = io.StringIO()
 
     # Header row
     header_cells = [f" {h:<{widths[i]}} " for i, h in enumerate(headers)]
-    lines.append("|" + "|".join(header_cells) + "|")
+    buf.write("|" + "|".join(header_cells) + "|")
 
     # Separator row
     sep_cells = []
@@ -52,14 +103,21 @@ def format_table(
         else:  # left
             sep = f":{'-' * (width + 1)}"
         sep_cells.append(sep)
-    lines.append("|" + "|".join(sep_cells) + "|")
+    buf.write("\n|" + "|".join(sep_cells) + "|")
+
+    # Pad each column with the C string method matching its alignment
+    pad_fns = [PAD_FUNCTIONS.get(align, str.ljust) for align in alignment]
+    pad_fns += [str.ljust] * (len(widths) - len(pad_fns))
 
-    # Data rows
+    # Data rows, stringifying each cell once
     for row in data:
-        cells = [f" {str(cell):<{widths[i]}} " for i, cell in enumerate(row)]
-        lines.append("|" + "|".join(cells) + "|")
+        cells = [
+            pad(cell, width)
+            for pad, cell, width in zip(pad_fns, map(str, row), widths)
+        ]
+        buf.write("\n| " + " | ".join(cells) + " |" if cells else "\n||")
 
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
 def csv_to_markdown(
@@ -79,17 +137,6 @@ def csv_to_markdown(
         Markdown table string
     """
     try:
-        with open(csv_file, "r", encoding="utf-8") as f:
-            reader = csv.reader(f)
-            rows = list(reader)
-
-        if not rows:
-            print("[ERROR] CSV file is empty")
-            sys.exit(1)
-
-        headers = rows[0]
-        data = rows[1:]
-
         # Parse alignment
         align_map = {"l": "left", "c": "center", "r": "right"}
         if alignment:
@@ -97,7 +144,22 @@ def csv_to_markdown(
         else:
             alignments = None
 
-        table = format_table(data, headers, alignments)
+        # Two streaming passes (widths, then rows) so the CSV is never
+        # held in memory as a list of rows
+        with open(csv_file, "r", encoding="utf-8") as f:
+            reader = csv.reader(f)
+            headers = next(reader, None)
+
+            if headers is None:
+                print("[ERROR] CSV file is empty")
+                sys.exit(1)
+
+            widths = column_widths(headers, reader)
+
+            f.seek(0)
+            reader = csv.reader(f)
+            next(reader)
+            table = format_table(reader, headers, alignments, widths)
 
         if output_file:
             with open(output_file, "w", encoding="utf-8") as f:
@@ -133,8 +195,11 @@ def json_to_markdown(
         Markdown table string
     """
     try:
-        with open(json_file, "r", encoding="utf-8") as f:
-            json_data = json.load(f)
+        if orjson:
+            json_data = orjson.loads(Path(json_file).read_bytes())
+        else:
+            with open(json_file, "r", encoding="utf-8") as f:
+                json_data = json.load(f)
 
         if not isinstance(json_data, list):
             print("[ERROR] JSON must be an array of objects")
@@ -147,8 +212,16 @@ def json_to_markdown(
         # Extract headers from first object
         headers = list(json_data[0].keys())
 
-        # Extract data rows
-        data = [[str(obj.get(h, "")) for h in headers] for obj in json_data]
+        # Extract data rows with one C-level itemgetter per row, falling
+        # back to .get() when objects don't all share the first one's keys
+        try:
+            get_row = itemgetter(*headers)
+            if len(headers) == 1:
+                data = [[str(get_row(obj))] for obj in json_data]
+            else:
+                data = [list(map(str, get_row(obj))) for obj in json_data]
+        except (KeyError, TypeError):
+            data = [[str(obj.get(h, "")) for h in headers] for obj in json_data]
 
         # Parse alignment
         align_map = {"l": "left", "c": "center", "r": "right"}
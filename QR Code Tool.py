@@ -3,29 +3,52 @@
 
 import argparse
 import csv
+import os
+import pickle
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import qrcode
 from PIL import Image
 
 try:
-    from pyzbar.pyzbar import decode
-    SCANNER_AVAILABLE = True
+    import zxingcpp
+    SCANNER_AVAILABLE = "zxingcpp"
 except ImportError:
-    SCANNER_AVAILABLE = False
     try:
-        import cv2
-        SCANNER_AVAILABLE = "opencv"
+        from pyzbar.pyzbar import decode
+        SCANNER_AVAILABLE = True
     except ImportError:
-        pass
+        SCANNER_AVAILABLE = False
+        try:
+            import cv2
+            SCANNER_AVAILABLE = "opencv"
+        except ImportError:
+            pass
+
+
+# QRCode reused by every job a batch worker process runs
+_worker_qr = None
+
+
+def new_qr(size: int = 10, border: int = 4) -> qrcode.QRCode:
+    """Create a QRCode encoder with the tool's default settings."""
+    return qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=size,
+        border=border,
+    )
 
 
 def generate_qr(
     data: str,
     output_file: str = "qrcode.png",
     size: int = 10,
-    border: int = 4
+    border: int = 4,
+    qr: Optional[qrcode.QRCode] = None
 ) -> None:
     """
     Generate QR code from text/URL.
@@ -35,14 +58,16 @@ def generate_qr(
         output_file: Output image filename
         size: Box size (default: 10)
         border: Border size in boxes (default: 4)
+        qr: Existing encoder to reuse (size and border come from it)
     """
     try:
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_L,
-            box_size=size,
-            border=border,
-        )
+        if qr is None:
+            qr = new_qr(size, border)
+        else:
+            # Reset the reused encoder so make() fits from version 1 again
+            qr.clear()
+            qr.version = 1
+
         qr.add_data(data)
         qr.make(fit=True)
 
@@ -57,6 +82,18 @@ def generate_qr(
         sys.exit(1)
 
 
+def _init_worker() -> None:
+    """Give each batch worker process its own reusable encoder."""
+    global _worker_qr
+    _worker_qr = new_qr()
+
+
+def _generate_one(job: Tuple[str, str]) -> None:
+    """Generate a single (data, output_file) job in a worker."""
+    data, output_file = job
+    generate_qr(data, output_file, qr=_worker_qr)
+
+
 def batch_generate(csv_file: str, output_dir: str = "qrcodes") -> None:
     """
     Generate QR codes from CSV file.
@@ -76,7 +113,7 @@ def batch_generate(csv_file: str, output_dir: str = "qrcodes") -> None:
                 print("[ERROR] CSV must have 'data' column")
                 sys.exit(1)
 
-            count = 0
+            jobs = []
             for i, row in enumerate(reader, 1):
                 data = row["data"]
                 filename = row.get("filename", f"qr_{i}.png")
@@ -84,11 +121,26 @@ def batch_generate(csv_file: str, output_dir: str = "qrcodes") -> None:
                 if not filename.endswith(".png"):
                     filename += ".png"
 
-                output_file = output_path / filename
-                generate_qr(data, str(output_file))
-                count += 1
+                jobs.append((data, str(output_path / filename)))
+
+        # QR encoding is CPU-bound, so spread larger batches across cores.
+        # Workers import this module by name, which fails when it was
+        # loaded from a file path (as app.py does); encode serially then
+        use_pool = len(jobs) >= 4
+        if use_pool:
+            chunksize = max(1, len(jobs) // (4 * (os.cpu_count() or 1)))
+            try:
+                with ProcessPoolExecutor(initializer=_init_worker) as executor:
+                    list(executor.map(_generate_one, jobs, chunksize=chunksize))
+            except (pickle.PicklingError, BrokenProcessPool):
+                use_pool = False
+
+        if not use_pool:
+            qr = new_qr()
+            for data, output_file in jobs:
+                generate_qr(data, output_file, qr=qr)
 
-        print(f"[OK] Generated {count} QR codes in {output_dir}")
+        print(f"[OK] Generated {len(jobs)} QR codes in {output_dir}")
 
     except FileNotFoundError:
         print(f"[ERROR] CSV file not found: {csv_file}")
@@ -111,8 +163,9 @@ def scan_qr(image_file: str) -> List[str]:
     if not SCANNER_AVAILABLE:
         print("[ERROR] QR scanning not available")
         print("[INFO] Install scanner library:")
-        print("  Option 1: pip install pyzbar (requires ZBar DLL on Windows)")
-        print("  Option 2: pip install opencv-python")
+        print("  Option 1: pip install zxing-cpp (fastest)")
+        print("  Option 2: pip install pyzbar (requires ZBar DLL on Windows)")
+        print("  Option 3: pip install opencv-python")
         sys.exit(1)
 
     try:
@@ -120,7 +173,23 @@ def scan_qr(image_file: str) -> List[str]:
             print(f"[ERROR] Image file not found: {image_file}")
             sys.exit(1)
 
-        if SCANNER_AVAILABLE == "opencv":
+        if SCANNER_AVAILABLE == "zxingcpp":
+            # Use zxing-cpp, which reads the PIL image buffer directly
+            img = Image.open(image_file)
+            barcodes = zxingcpp.read_barcodes(img)
+
+            if not barcodes:
+                print("[WARN] No QR codes found in image")
+                return []
+
+            results = []
+            for barcode in barcodes:
+                results.append(barcode.text)
+                print(f"[OK] Decoded: {barcode.text}")
+                print(f"[INFO] Type: {barcode.format}")
+
+            return results
+        elif SCANNER_AVAILABLE == "opencv":
             # Use OpenCV QR detector
             import cv2
             img = cv2.imread(image_file)
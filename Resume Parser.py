@@ -4,27 +4,107 @@
 import argparse
 import json
 import re
+import string
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
-import PyPDF2
+from typing import Dict, Final, FrozenSet, Iterator, List, Optional, Pattern, Tuple
+import pypdfium2 as pdfium
 from docx import Document
 
-
-def extract_text_from_pdf(pdf_file: str) -> str:
-    """Extract text from PDF file."""
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+
+# Various phone formats, scanned as one alternation
+PHONE_PATTERN = "|".join([
+    r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
+    r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
+    r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}'
+])
+
+URL_PATTERN = r'https?://(?:www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b(?:[-a-zA-Z0-9()@:%_\+.~#?&/=]*)'
+
+# Compiled once at import instead of on every extract_* call
+EMAIL_RE = re.compile(EMAIL_PATTERN)
+PHONE_RE = re.compile(PHONE_PATTERN)
+# RE2 matches in linear time, so hostile input can't trigger backtracking
+URL_RE = (re2 or re).compile(URL_PATTERN)
+
+# All contact patterns fused so parse_resume walks the text once. URLs come
+# first so digits and '@' inside a link aren't taken as a phone or email
+CONTACT_RE = (re2 or re).compile(
+    f"(?P<url>{URL_PATTERN})|(?P<email>{EMAIL_PATTERN})|(?P<phone>{PHONE_PATTERN})"
+)
+
+# Whole lines containing an education keyword, found in one pass over the
+# text. Only a leading \b: a trailing one would never match after the final
+# '.' of "b.s." and friends
+EDUCATION_RE: Final[Pattern[str]] = re.compile(
+    r'^.*?\b(?:university|college|bachelor|master|phd|degree|b\.s\.|m\.s\.|b\.a\.|m\.a\.).*$',
+    re.IGNORECASE | re.MULTILINE
+)
+
+# Common skill keywords
+SKILL_KEYWORDS: Final[Tuple[str, ...]] = (
+    "python", "javascript", "java", "c++", "c#", "ruby", "php", "swift", "kotlin",
+    "react", "angular", "vue", "node", "django", "flask", "spring",
+    "sql", "mongodb", "postgresql", "mysql", "redis",
+    "aws", "azure", "gcp", "docker", "kubernetes",
+    "git", "agile", "scrum", "jira",
+    "machine learning", "ai", "data analysis", "statistics"
+)
+
+# A skill only counts as a whole word: not preceded or followed by an ASCII
+# word character, so "java" isn't found in "javascript" nor "ai" in "email".
+# Lookarounds rather than \b so keywords ending in a symbol (c++, c#) match
+WORD_CHARS: Final[FrozenSet[str]] = frozenset(string.ascii_letters + string.digits + "_")
+
+# Every keyword in one alternation, longest first so the most specific wins
+SKILL_RE: Final[Pattern[str]] = re.compile(
+    r'(?<!\w)(?:'
+    + "|".join(map(re.escape, sorted(SKILL_KEYWORDS, key=len, reverse=True)))
+    + r')(?!\w)',
+    re.ASCII
+)
+
+# Aho-Corasick automaton finding every keyword in one pass over the text
+if ahocorasick:
+    SKILL_AUTOMATON = ahocorasick.Automaton()
+    for skill in SKILL_KEYWORDS:
+        SKILL_AUTOMATON.add_word(skill, (skill.title(), len(skill)))
+    SKILL_AUTOMATON.make_automaton()
+else:
+    SKILL_AUTOMATON = None
+
+
+def iter_pdf_pages(pdf_file: str) -> Iterator[str]:
+    """Yield the text of each PDF page in turn."""
     try:
-        text = ""
-        with open(pdf_file, "rb") as f:
-            reader = PyPDF2.PdfReader(f)
-            for page in reader.pages:
-                text += page.extract_text() + "\n"
-        return text
+        # PDFium extracts text in native code; it separates lines with CRLF
+        pdf = pdfium.PdfDocument(pdf_file)
+        try:
+            for page in pdf:
+                yield page.get_textpage().get_text_range().replace("\r\n", "\n") + "\n"
+        finally:
+            pdf.close()
     except Exception as e:
         print(f"[ERROR] Failed to read PDF: {e}")
         sys.exit(1)
 
 
+def extract_text_from_pdf(pdf_file: str) -> str:
+    """Extract text from PDF file."""
+    return "".join(iter_pdf_pages(pdf_file))
+
+
 def extract_text_from_docx(docx_file: str) -> str:
     """Extract text from DOCX file."""
     try:
@@ -38,30 +118,28 @@ def extract_text_from_docx(docx_file: str) -> str:
 
 def extract_email(text: str) -> Optional[str]:
     """Extract email address from text."""
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    matches = re.findall(email_pattern, text)
-    return matches[0] if matches else None
+    match = EMAIL_RE.search(text)
+    return match.group() if match else None
 
 
 def extract_phone(text: str) -> Optional[str]:
     """Extract phone number from text."""
-    # Various phone formats
-    phone_patterns = [
-        r'\+?\d{1,3}[-.\s]?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-        r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}',
-        r'\d{3}[-.\s]?\d{3}[-.\s]?\d{4}'
-    ]
-    for pattern in phone_patterns:
-        matches = re.findall(pattern, text)
-        if matches:
-            return matches[0]
-    return None
+    match = PHONE_RE.search(text)
+    return match.group() if match else None
 
 
 def extract_urls(text: str) -> List[str]:
     """Extract URLs from text."""
-    url_pattern = r'https?://(?:www\.)?[-a-zA-Z0-9@:%._\+~#=]{1,256}\.[a-zA-Z0-9()]{1,6}\b(?:[-a-zA-Z0-9()@:%_\+.~#?&/=]*)'
-    return re.findall(url_pattern, text)
+    return URL_RE.findall(text)
+
+
+def extract_contacts(text: str) -> Dict[str, List[str]]:
+    """Extract all URLs, emails and phone numbers in a single scan."""
+    contacts = {"url": [], "email": [], "phone": []}
+
+    for match in CONTACT_RE.finditer(text):
+        contacts[match.lastgroup].append(match.group())
+    return contacts
 
 
 def extract_name(text: str) -> Optional[str]:
@@ -78,37 +156,43 @@ def extract_name(text: str) -> Optional[str]:
 
 def extract_skills(text: str) -> List[str]:
     """Extract skills from text."""
-    # Common skill keywords
-    skill_keywords = [
-        "python", "javascript", "java", "c++", "c#", "ruby", "php", "swift", "kotlin",
-        "react", "angular", "vue", "node", "django", "flask", "spring",
-        "sql", "mongodb", "postgresql", "mysql", "redis",
-        "aws", "azure", "gcp", "docker", "kubernetes",
-        "git", "agile", "scrum", "jira",
-        "machine learning", "ai", "data analysis", "statistics"
-    ]
-
-    found_skills = []
     text_lower = text.lower()
 
-    for skill in skill_keywords:
-        if skill in text_lower:
-            found_skills.append(skill.title())
+    if SKILL_AUTOMATON is not None:
+        # The automaton reports every occurrence, word or not, so check the
+        # boundaries and keep the first of each
+        found_skills = {}
+        for end, (title, length) in SKILL_AUTOMATON.iter(text_lower):
+            start = end - length + 1
+            if ((start == 0 or text_lower[start - 1] not in WORD_CHARS)
+                    and (end + 1 == len(text_lower) or text_lower[end + 1] not in WORD_CHARS)):
+                found_skills[title] = None
+        return list(found_skills)
 
-    return list(set(found_skills))  # Remove duplicates
+    return list(dict.fromkeys(
+        match.group().title() for match in SKILL_RE.finditer(text_lower)
+    ))
 
 
 def extract_education(text: str) -> List[str]:
     """Extract education information."""
-    education_keywords = ["university", "college", "bachelor", "master", "phd", "degree", "b.s.", "m.s.", "b.a.", "m.a."]
-    education = []
+    return [match.group().strip() for match in EDUCATION_RE.finditer(text)]
+
+
+def iter_pages(file_path: str) -> Iterator[str]:
+    """
+    Yield resume text one page at a time.
 
-    lines = text.split("\n")
-    for i, line in enumerate(lines):
-        if any(keyword in line.lower() for keyword in education_keywords):
-            education.append(line.strip())
+    Args:
+        file_path: Path to resume file (PDF or DOCX)
 
-    return education
+    Returns:
+        Iterator of page texts (a DOCX is a single page)
+    """
+    if Path(file_path).suffix.lower() == ".pdf":
+        yield from iter_pdf_pages(file_path)
+    else:
+        yield extract_text_from_docx(file_path)
 
 
 def parse_resume(file_path: str) -> Dict:
@@ -129,24 +213,48 @@ def parse_resume(file_path: str) -> Dict:
 
     print(f"[INFO] Parsing resume: {file_path}")
 
-    # Extract text
-    if path.suffix.lower() == ".pdf":
-        text = extract_text_from_pdf(file_path)
-    elif path.suffix.lower() == ".docx":
-        text = extract_text_from_docx(file_path)
-    else:
+    if path.suffix.lower() not in (".pdf", ".docx"):
         print("[ERROR] File must be .pdf or .docx")
         sys.exit(1)
 
-    # Extract data
+    name = None
+    name_checked = False
+    contacts = {"url": [], "email": [], "phone": []}
+    skills = {}
+    education = []
+    raw_text = ""
+    text_length = 0
+
+    # Extract data page by page so the whole document is never one string
+    for page in iter_pages(file_path):
+        # Name comes from the first non-empty line of the document
+        if not name_checked and page.strip():
+            name = extract_name(page)
+            name_checked = True
+
+        # Once an email and phone are found, later pages only need URLs
+        if contacts["email"] and contacts["phone"]:
+            contacts["url"].extend(extract_urls(page))
+        else:
+            for kind, found in extract_contacts(page).items():
+                contacts[kind].extend(found)
+
+        skills.update(dict.fromkeys(extract_skills(page)))
+        education.extend(extract_education(page))
+
+        # Keep only the first 500 chars of raw text
+        if len(raw_text) < 500:
+            raw_text += page[:500 - len(raw_text)]
+        text_length += len(page)
+
     resume_data = {
-        "name": extract_name(text),
-        "email": extract_email(text),
-        "phone": extract_phone(text),
-        "urls": extract_urls(text),
-        "skills": extract_skills(text),
-        "education": extract_education(text),
-        "raw_text": text[:500] + "..." if len(text) > 500 else text  # First 500 chars
+        "name": name,
+        "email": contacts["email"][0] if contacts["email"] else None,
+        "phone": contacts["phone"][0] if contacts["phone"] else None,
+        "urls": contacts["url"],
+        "skills": list(skills),
+        "education": education,
+        "raw_text": raw_text + "..." if text_length > 500 else raw_text
     }
 
     return resume_data
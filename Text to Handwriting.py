@@ -3,15 +3,52 @@
 
 import argparse
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Tuple
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
-import random
 
+# Handwriting-like fonts, in order of preference
+FONT_PATHS = [
+    "C:/Windows/Fonts/segoepr.ttf",  # Segoe Print (Windows)
+    "C:/Windows/Fonts/comic.ttf",     # Comic Sans (fallback)
+    "/System/Library/Fonts/MarkerFelt.ttc",  # Mac
+    "/usr/share/fonts/truetype/liberation/LiberationSerif-Regular.ttf"  # Linux
+]
 
-def create_handwriting_image(
+COLOR_MAP = {
+    "black": (0, 0, 0),
+    "blue": (0, 0, 139),
+    "darkblue": (0, 0, 139),
+    "navy": (0, 0, 128),
+    "red": (139, 0, 0),
+    "green": (0, 100, 0),
+    "purple": (128, 0, 128),
+    "brown": (101, 67, 33),
+    "white": (255, 255, 255),
+    "cream": (255, 255, 240),
+    "ivory": (255, 255, 240)
+}
+
+
+# Seeded from OS entropy once, not on every render
+_RNG = np.random.default_rng()
+
+
+@lru_cache(maxsize=16)
+def load_font(font_size: int) -> ImageFont.ImageFont:
+    """Load the first available handwriting font, probing paths once per size."""
+    for font_path in FONT_PATHS:
+        if Path(font_path).exists():
+            return ImageFont.truetype(font_path, font_size)
+
+    print("[WARN] Handwriting font not found, using default font")
+    return ImageFont.load_default()
+
+
+def render_handwriting(
     text: str,
-    output_file: str = "handwriting.png",
     font_size: int = 40,
     line_spacing: int = 60,
     ink_color: Tuple[int, int, int] = (0, 0, 139),
@@ -19,13 +56,12 @@ def create_handwriting_image(
     width: int = 800,
     margin: int = 50,
     variation: bool = True
-) -> None:
+) -> Image.Image:
     """
-    Create handwriting-style image from text.
+    Render text as a handwriting-style image in memory.
 
     Args:
         text: Text to convert
-        output_file: Output image filename
         font_size: Base font size
         line_spacing: Space between lines
         ink_color: RGB tuple for ink color
@@ -33,47 +69,32 @@ def create_handwriting_image(
         width: Image width
         margin: Page margins
         variation: Add random variations for realism
+
+    Returns:
+        Rendered image
     """
-    try:
-        # Try to use a handwriting-like font
-        font_paths = [
-            "C:/Windows/Fonts/segoepr.ttf",  # Segoe Print (Windows)
-            "C:/Windows/Fonts/comic.ttf",     # Comic Sans (fallback)
-            "/System/Library/Fonts/MarkerFelt.ttc",  # Mac
-            "/usr/share/fonts/truetype/liberation/LiberationSerif-Regular.ttf"  # Linux
-        ]
-
-        font = None
-        for font_path in font_paths:
-            if Path(font_path).exists():
-                font = ImageFont.truetype(font_path, font_size)
-                break
-
-        if not font:
-            print("[WARN] Handwriting font not found, using default font")
-            font = ImageFont.load_default()
-
-        # Split text into lines
-        lines = text.split("\n")
-
-        # Calculate image height
-        height = margin * 2 + (len(lines) * line_spacing)
-
-        # Create image
-        img = Image.new("RGB", (width, height), paper_color)
-        draw = ImageDraw.Draw(img)
+    font = load_font(font_size)
+
+    # Split text into lines
+    lines = text.split("\n")
+
+    # Calculate image height
+    height = margin * 2 + (len(lines) * line_spacing)
+
+    # Create image
+    img = Image.new("RGB", (width, height), paper_color)
+    draw = ImageDraw.Draw(img)
+
+    if variation:
+        # Slight random vertical offset per line for natural look,
+        # drawn for all lines in one batch
+        y_offsets = _RNG.integers(-2, 3, size=len(lines))
 
         # Draw text with variations
         y_pos = margin
-        for line in lines:
+        for line, y_offset in zip(lines, y_offsets.tolist()):
             x_pos = margin
 
-            if variation:
-                # Add slight random vertical offset for natural look
-                y_offset = random.randint(-2, 2)
-            else:
-                y_offset = 0
-
             # Draw the line
             draw.text(
                 (x_pos, y_pos + y_offset),
@@ -83,6 +104,51 @@ def create_handwriting_image(
             )
 
             y_pos += line_spacing
+    else:
+        # No per-line offsets, so let Pillow lay out every line in one
+        # call. Its line pitch is the height of "A" plus spacing
+        spacing = line_spacing - draw.textbbox((0, 0), "A", font=font)[3]
+        draw.multiline_text(
+            (margin, margin),
+            text,
+            font=font,
+            fill=ink_color,
+            spacing=spacing
+        )
+
+    return img
+
+
+def create_handwriting_image(
+    text: str,
+    output_file: str = "handwriting.png",
+    font_size: int = 40,
+    line_spacing: int = 60,
+    ink_color: Tuple[int, int, int] = (0, 0, 139),
+    paper_color: Tuple[int, int, int] = (255, 255, 240),
+    width: int = 800,
+    margin: int = 50,
+    variation: bool = True
+) -> None:
+    """
+    Create handwriting-style image from text.
+
+    Args:
+        text: Text to convert
+        output_file: Output image filename
+        font_size: Base font size
+        line_spacing: Space between lines
+        ink_color: RGB tuple for ink color
+        paper_color: RGB tuple for paper background
+        width: Image width
+        margin: Page margins
+        variation: Add random variations for realism
+    """
+    try:
+        img = render_handwriting(
+            text, font_size, line_spacing, ink_color, paper_color,
+            width, margin, variation
+        )
 
         # Save image
         img.save(output_file)
@@ -103,25 +169,11 @@ def parse_color(color_str: str) -> Tuple[int, int, int]:
     Returns:
         RGB tuple
     """
-    color_map = {
-        "black": (0, 0, 0),
-        "blue": (0, 0, 139),
-        "darkblue": (0, 0, 139),
-        "navy": (0, 0, 128),
-        "red": (139, 0, 0),
-        "green": (0, 100, 0),
-        "purple": (128, 0, 128),
-        "brown": (101, 67, 33),
-        "white": (255, 255, 255),
-        "cream": (255, 255, 240),
-        "ivory": (255, 255, 240)
-    }
-
     color_lower = color_str.lower()
 
     # Check color map
-    if color_lower in color_map:
-        return color_map[color_lower]
+    if color_lower in COLOR_MAP:
+        return COLOR_MAP[color_lower]
 
     # Try hex code
     if color_str.startswith("#"):
@@ -2,10 +2,27 @@
 # ABOUTME: Provides daily weather summary with configurable location and alerts
 
 import argparse
+import asyncio
+import heapq
 import sys
-from datetime import datetime
-from typing import Dict, Optional
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+
+# Shared session so repeated and concurrent fetches reuse pooled keep-alive
+# connections instead of a new TCP+TLS handshake per request
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=10))
+
+# Forecast conditions that raise an alert, and the label each is reported as
+ALERT_LABELS = {
+    "Rain": "Rain",
+    "Drizzle": "Rain",
+    "Snow": "Snow",
+    "Thunderstorm": "Thunderstorm"
+}
+ALERT_SET = frozenset(ALERT_LABELS)
 
 
 def get_weather(city: str, api_key: str) -> Dict:
@@ -28,7 +45,7 @@ def get_weather(city: str, api_key: str) -> Dict:
             "cnt": 8  # 24 hours (3-hour intervals)
         }
 
-        response = requests.get(url, params=params, timeout=10)
+        response = _SESSION.get(url, params=params, timeout=10)
         response.raise_for_status()
         return response.json()
 
@@ -37,57 +54,119 @@ def get_weather(city: str, api_key: str) -> Dict:
         sys.exit(1)
 
 
-def analyze_forecast(data: Dict) -> Dict[str, any]:
+async def get_weather_async(cities: List[str], api_key: str) -> List[Dict]:
+    """
+    Fetch weather data for several cities concurrently.
+
+    Args:
+        cities: City names
+        api_key: OpenWeatherMap API key
+
+    Returns:
+        Weather data dictionaries, in the same order as cities
+    """
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(*[
+        loop.run_in_executor(None, get_weather, city, api_key)
+        for city in cities
+    ])
+
+
+def format_hour(timestamp: int, utc_offset: int) -> str:
+    """
+    Format a UTC timestamp as a 12-hour clock hour (e.g., '03PM').
+
+    Args:
+        timestamp: Unix timestamp in seconds
+        utc_offset: Location's offset from UTC in seconds
+
+    Returns:
+        Hour string matching strftime("%I%p")
+    """
+    hour = (timestamp + utc_offset) // 3600 % 24
+    return f"{hour % 12 or 12:02d}{'AM' if hour < 12 else 'PM'}"
+
+
+def analyze_forecast(data: Dict, include_conditions: bool = True) -> Dict[str, any]:
     """
     Analyze forecast for alerts.
 
     Args:
         data: Weather API response
+        include_conditions: Collect each interval's description (verbose output)
 
     Returns:
-        Analysis with alerts
+        Analysis with alerts as (label, timestamp, detail) records; see
+        format_alerts for display strings
     """
-    alerts = []
     conditions = []
-    temps = []
 
-    for item in data["list"]:
-        temp = item["main"]["temp"]
-        temps.append(temp)
+    # All temperatures in one array so stats and extreme checks run in C
+    temps = np.fromiter(
+        (item["main"]["temp"] for item in data["list"]),
+        dtype=np.float64,
+        count=len(data["list"])
+    )
 
+    condition_alerts = []
+    for i, item in enumerate(data["list"]):
         weather = item["weather"][0]
-        main_condition = weather["main"]
-        description = weather["description"]
-        conditions.append(description)
-
-        # Check for alerts
-        if main_condition in ["Rain", "Drizzle"]:
-            time = datetime.fromtimestamp(item["dt"]).strftime("%I%p")
-            alerts.append(f"Rain expected around {time}: {description}")
-        elif main_condition == "Snow":
-            time = datetime.fromtimestamp(item["dt"]).strftime("%I%p")
-            alerts.append(f"Snow expected around {time}: {description}")
-        elif main_condition == "Thunderstorm":
-            time = datetime.fromtimestamp(item["dt"]).strftime("%I%p")
-            alerts.append(f"Thunderstorm expected around {time}: {description}")
-
-        # Extreme temps
-        if temp > 35:
-            alerts.append(f"Extreme heat: {temp:.1f}C")
-        elif temp < -10:
-            alerts.append(f"Extreme cold: {temp:.1f}C")
+        if include_conditions:
+            conditions.append(weather["description"])
+
+        # Check for alerts, deferring formatting until display
+        if weather["main"] in ALERT_SET:
+            condition_alerts.append(
+                (i, (ALERT_LABELS[weather["main"]], item["dt"], weather["description"]))
+            )
+
+    # Extreme temps: only the flagged intervals are visited
+    extreme = np.flatnonzero((temps > 35) | (temps < -10))
+    temp_alerts = [
+        (i, ("Extreme heat" if temp > 35 else "Extreme cold", data["list"][i]["dt"], temp))
+        for i, temp in zip(extreme.tolist(), temps[extreme].tolist())
+    ]
+
+    # Interleave by interval, a condition alert before a temperature one
+    alerts = [
+        alert for _, alert in heapq.merge(condition_alerts, temp_alerts, key=lambda a: a[0])
+    ]
 
     return {
         "city": data["city"]["name"],
         "country": data["city"]["country"],
+        # Alert times are shown in the city's local time
+        "utc_offset": data["city"].get("timezone", 0),
         "alerts": alerts,
         "conditions": conditions,
-        "temp_min": min(temps),
-        "temp_max": max(temps),
-        "temp_avg": sum(temps) / len(temps)
+        "temp_min": float(temps.min()),
+        "temp_max": float(temps.max()),
+        "temp_avg": float(temps.mean())
     }
 
 
+def format_alert(alert: Tuple[str, int, Any], utc_offset: int) -> str:
+    """
+    Format an alert record for display.
+
+    Args:
+        alert: (label, timestamp, detail) record from analyze_forecast
+        utc_offset: City's offset from UTC in seconds
+
+    Returns:
+        Alert message
+    """
+    label, timestamp, detail = alert
+    if label.startswith("Extreme"):
+        return f"{label}: {detail:.1f}C"
+    return f"{label} expected around {format_hour(timestamp, utc_offset)}: {detail}"
+
+
+def format_alerts(analysis: Dict) -> List[str]:
+    """Format every alert in an analysis for display."""
+    return [format_alert(alert, analysis["utc_offset"]) for alert in analysis["alerts"]]
+
+
 def display_summary(analysis: Dict, verbose: bool = False) -> None:
     """
     Display weather summary.
@@ -101,7 +180,7 @@ def display_summary(analysis: Dict, verbose: bool = False) -> None:
 
     if analysis["alerts"]:
         print(f"\n[WARN] {len(analysis['alerts'])} alert(s) for next 24 hours:")
-        for alert in analysis["alerts"]:
+        for alert in format_alerts(analysis):
             print(f"  - {alert}")
     else:
         print("\n[OK] No weather alerts for next 24 hours")
@@ -119,7 +198,8 @@ def main() -> None:
     )
     parser.add_argument(
         "city",
-        help="City name (e.g., 'London', 'New York')"
+        nargs="+",
+        help="City name(s) (e.g., 'London', 'New York')"
     )
     parser.add_argument(
         "-k", "--api-key",
@@ -144,10 +224,15 @@ def main() -> None:
         print("  2. Or pass with -k flag: python 'Weather Alert.py' London -k your_key")
         sys.exit(1)
 
-    print(f"[INFO] Fetching weather for {args.city}...")
-    data = get_weather(args.city, api_key)
-    analysis = analyze_forecast(data)
-    display_summary(analysis, args.verbose)
+    print(f"[INFO] Fetching weather for {', '.join(args.city)}...")
+    if len(args.city) == 1:
+        forecasts = [get_weather(args.city[0], api_key)]
+    else:
+        forecasts = asyncio.run(get_weather_async(args.city, api_key))
+
+    for data in forecasts:
+        analysis = analyze_forecast(data, include_conditions=args.verbose)
+        display_summary(analysis, args.verbose)
 
 
 if __name__ == "__main__":
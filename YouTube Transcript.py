@@ -3,12 +3,21 @@
 
 import argparse
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api.formatters import TextFormatter, SRTFormatter, JSONFormatter
+from youtube_transcript_api.formatters import TextFormatter, JSONFormatter
 import re
 
+# Various YouTube URL formats fused into one alternation, so the URL is
+# scanned once; the group that participated in the match holds the ID
+_VIDEO_ID_RE = re.compile(
+    r'(?:youtube\.com/watch\?v=|youtu\.be/)([^&\n?]*)'
+    r'|youtube\.com/embed/([^&\n?]*)'
+    r'|^([a-zA-Z0-9_-]{11})$'  # Direct video ID
+)
+
 
 def extract_video_id(url: str) -> str:
     """
@@ -20,22 +29,31 @@ def extract_video_id(url: str) -> str:
     Returns:
         Video ID string
     """
-    # Handle various YouTube URL formats
-    patterns = [
-        r'(?:youtube\.com\/watch\?v=|youtu\.be\/)([^&\n?]*)',
-        r'youtube\.com\/embed\/([^&\n?]*)',
-        r'^([a-zA-Z0-9_-]{11})$'  # Direct video ID
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
+    match = _VIDEO_ID_RE.search(url)
+    if match:
+        return next(g for g in match.groups() if g is not None)
 
     print(f"[ERROR] Could not extract video ID from: {url}")
     sys.exit(1)
 
 
+@lru_cache(maxsize=128)
+def fetch_transcript(video_id: str, languages: Tuple[str, ...] = ()) -> List[dict]:
+    """Fetch a transcript once per (video, languages) and reuse the result."""
+    if languages:
+        return YouTubeTranscriptApi.get_transcript(
+            video_id,
+            languages=list(languages)
+        )
+    return YouTubeTranscriptApi.get_transcript(video_id)
+
+
+@lru_cache(maxsize=128)
+def fetch_transcript_list(video_id: str):
+    """Fetch the list of available transcripts once per video."""
+    return YouTubeTranscriptApi.list_transcripts(video_id)
+
+
 def get_transcript(
     video_id: str,
     languages: List[str] = None
@@ -51,15 +69,7 @@ def get_transcript(
         List of transcript segments
     """
     try:
-        if languages:
-            transcript = YouTubeTranscriptApi.get_transcript(
-                video_id,
-                languages=languages
-            )
-        else:
-            transcript = YouTubeTranscriptApi.get_transcript(video_id)
-
-        return transcript
+        return fetch_transcript(video_id, tuple(languages or ()))
 
     except Exception as e:
         print(f"[ERROR] Failed to get transcript: {e}")
@@ -70,7 +80,7 @@ def get_transcript(
 def list_available_transcripts(video_id: str) -> None:
     """List all available transcript languages."""
     try:
-        transcript_list = YouTubeTranscriptApi.list_transcripts(video_id)
+        transcript_list = fetch_transcript_list(video_id)
 
         print("\n[INFO] Available transcripts:")
         print("-" * 50)
@@ -87,6 +97,41 @@ def list_available_transcripts(video_id: str) -> None:
         sys.exit(1)
 
 
+def srt_timestamp(seconds: float) -> str:
+    """Format seconds as an SRT cue timestamp (HH:MM:SS,mmm)."""
+    seconds = float(seconds)
+    hours, remainder = divmod(int(seconds), 3600)
+    mins, secs = divmod(remainder, 60)
+    ms = int(round((seconds - int(seconds)) * 1000, 2))
+    return f"{hours:02d}:{mins:02d}:{secs:02d},{ms:03d}"
+
+
+def transcript_to_srt(transcript: List[dict]) -> str:
+    """
+    Format transcript as SRT subtitles in a single pass.
+
+    Args:
+        transcript: Transcript data
+
+    Returns:
+        SRT string, identical to youtube_transcript_api's SRTFormatter output
+    """
+    cues = []
+    last = len(transcript) - 1
+
+    for i, entry in enumerate(transcript):
+        start = entry["start"]
+        end = start + entry["duration"]
+        # Clip a cue that runs into the next one
+        if i < last and transcript[i + 1]["start"] < end:
+            end = transcript[i + 1]["start"]
+        cues.append(
+            f"{i + 1}\n{srt_timestamp(start)} --> {srt_timestamp(end)}\n{entry['text']}"
+        )
+
+    return "\n\n".join(cues) + "\n"
+
+
 def format_transcript(
     transcript: List[dict],
     format_type: str = "text",
@@ -104,8 +149,7 @@ def format_transcript(
         Formatted transcript string
     """
     if format_type == "srt":
-        formatter = SRTFormatter()
-        return formatter.format_transcript(transcript)
+        return transcript_to_srt(transcript)
     elif format_type == "json":
         formatter = JSONFormatter()
         return formatter.format_transcript(transcript)
@@ -2,6 +2,10 @@
 # ABOUTME: Provides unified UI to run all 12 utilities from browser
 
 import streamlit as st
+import concurrent.futures
+import hashlib
+import io
+import shutil
 import tempfile
 import os
 from pathlib import Path
@@ -14,7 +18,173 @@ load_dotenv()
 import sys
 sys.path.append(str(Path(__file__).parent))
 
-from importlib import import_module
+import importlib.util
+
+
+def _load_tool(name: str, path: str):
+    """
+    Load a utility script as a module once per session and reuse it across reruns.
+
+    Modules are kept in session state rather than a process-wide cache,
+    since some hold state (e.g., a TTS engine) that shouldn't be shared
+    between users.
+    """
+    modules = st.session_state.setdefault("_tool_modules", {})
+    if name not in modules:
+        spec = importlib.util.spec_from_file_location(name, path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        modules[name] = module
+    return modules[name]
+
+
+# Uploads are copied to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _upload_digest(uploaded_file) -> str:
+    """BLAKE2b digest of an upload, hashed in place without copying it."""
+    return hashlib.blake2b(uploaded_file.getbuffer(), digest_size=16).hexdigest()
+
+
+def _save_upload(uploaded_file, suffix: str) -> str:
+    """
+    Stream an upload to a temp file in chunks.
+
+    Args:
+        uploaded_file: Streamlit UploadedFile
+        suffix: Temp file suffix (e.g., '.pdf')
+
+    Returns:
+        Temp file path
+    """
+    uploaded_file.seek(0)
+    with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+        shutil.copyfileobj(uploaded_file, tmp, UPLOAD_CHUNK_SIZE)
+    return tmp.name
+
+
+# Parsed results are cached by the upload's digest, so reruns and repeat
+# clicks on the same file skip both the temp file and the parse. Arguments
+# starting with '_' aren't hashed by Streamlit; they're only read on a miss
+
+@st.cache_data(show_spinner=False)
+def _read_exif_cached(digest: str, _upload) -> dict:
+    """Read EXIF data from an uploaded image."""
+    module = _load_tool("exif_editor", str(Path(__file__).parent / "EXIF Editor.py"))
+    tmp_path = _save_upload(_upload, ".jpg")
+    try:
+        return module.read_exif(tmp_path)
+    finally:
+        os.unlink(tmp_path)
+
+
+@st.cache_data(show_spinner=False)
+def _parse_resume_cached(digest: str, suffix: str, _upload) -> dict:
+    """Parse an uploaded resume."""
+    module = _load_tool("resume_parser", str(Path(__file__).parent / "Resume Parser.py"))
+    tmp_path = _save_upload(_upload, suffix)
+    try:
+        return module.parse_resume(tmp_path)
+    finally:
+        os.unlink(tmp_path)
+
+
+@st.cache_data(show_spinner=False)
+def _markdown_table_cached(digest: str, suffix: str, alignment: str, _upload) -> str:
+    """Convert an uploaded CSV or JSON file to a markdown table."""
+    module = _load_tool("md_table", str(Path(__file__).parent / "Markdown Table Generator.py"))
+    tmp_path = _save_upload(_upload, suffix)
+    try:
+        if suffix == ".csv":
+            return module.csv_to_markdown(tmp_path, alignment or None)
+        return module.json_to_markdown(tmp_path, alignment or None)
+    finally:
+        os.unlink(tmp_path)
+
+
+@st.cache_resource
+def _qr_scanner():
+    """
+    Pick the QR decoder once per server process.
+
+    Returns:
+        ("pyzbar", decode function) or ("opencv", cv2.QRCodeDetector)
+    """
+    try:
+        from pyzbar.pyzbar import decode
+        return "pyzbar", decode
+    except ImportError:
+        import cv2
+        return "opencv", cv2.QRCodeDetector()
+
+
+@st.cache_resource
+def _download_pool() -> concurrent.futures.ThreadPoolExecutor:
+    """Worker threads for video downloads, shared by all sessions."""
+    return concurrent.futures.ThreadPoolExecutor(max_workers=2)
+
+
+def _show_downloads() -> None:
+    """List this session's background downloads and their progress in the sidebar."""
+    downloads = st.session_state.get("downloads")
+    if not downloads:
+        return
+
+    with st.sidebar:
+        st.divider()
+        st.subheader("Downloads")
+        for progress, future in downloads:
+            if not future.done():
+                st.progress(progress["fraction"], text=progress["url"])
+            elif future.exception() is None:
+                st.success(f"Done: {progress['url']}")
+            else:
+                st.error(f"Failed: {progress['url']}")
+        st.button("Refresh downloads")
+
+
+@st.cache_data
+def _make_qr_png(data: str, size: int) -> bytes:
+    """Encode data as a QR code PNG, cached per (data, size)."""
+    import qrcode
+
+    qr = qrcode.QRCode(version=1, box_size=size, border=4)
+    qr.add_data(data)
+    qr.make(fit=True)
+    img = qr.make_image(fill_color="black", back_color="white")
+
+    buf = io.BytesIO()
+    img.save(buf, "PNG")
+    return buf.getvalue()
+
+
+@st.cache_data
+def _render_handwriting(
+    text: str,
+    font_size: int,
+    line_spacing: int,
+    ink_rgb: tuple,
+    paper_rgb: tuple
+) -> bytes:
+    """Render handwriting as PNG bytes, cached per set of inputs."""
+    module = _load_tool("text_handwriting", str(Path(__file__).parent / "Text to Handwriting.py"))
+    img = module.render_handwriting(text, font_size, line_spacing, ink_rgb, paper_rgb)
+
+    buf = io.BytesIO()
+    img.save(buf, "PNG")
+    return buf.getvalue()
+
+
+@st.cache_data(show_spinner=False)
+def _article_mp3(url: str) -> bytes:
+    """Convert an article to MP3 bytes, cached per URL."""
+    module = _load_tool("articles_pod", str(Path(__file__).parent / "Articles-pod.py"))
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        output_file = str(Path(tmp_dir) / "article.mp3")
+        module.article_to_audio(url, output_file)
+        return Path(output_file).read_bytes()
 
 
 def main():
@@ -31,79 +201,18 @@ def main():
     st.sidebar.title("Navigation")
     category = st.sidebar.radio(
         "Select Category:",
-        ["Script Generator", "Content Tools", "File Tools", "Web Tools", "Data Tools"]
+        ["Script Generator", *TOOLS]
     )
 
     # Script Generator
     if category == "Script Generator":
         script_generator_ui()
+        return
 
-    # Content Tools
-    elif category == "Content Tools":
-        tool = st.sidebar.selectbox(
-            "Select Tool:",
-            [
-                "Articles to Audio",
-                "YouTube Video Downloader",
-                "YouTube Transcript",
-                "QR Code Tool",
-                "Text to Handwriting"
-            ]
-        )
-
-        if tool == "Articles to Audio":
-            articles_to_audio_ui()
-        elif tool == "YouTube Video Downloader":
-            video_downloader_ui()
-        elif tool == "YouTube Transcript":
-            youtube_transcript_ui()
-        elif tool == "QR Code Tool":
-            qr_code_ui()
-        elif tool == "Text to Handwriting":
-            text_to_handwriting_ui()
-
-    # File Tools
-    elif category == "File Tools":
-        tool = st.sidebar.selectbox(
-            "Select Tool:",
-            [
-                "EXIF Editor",
-                "Resume Parser",
-                "Markdown Table Generator"
-            ]
-        )
-
-        if tool == "EXIF Editor":
-            exif_editor_ui()
-        elif tool == "Resume Parser":
-            resume_parser_ui()
-        elif tool == "Markdown Table Generator":
-            markdown_table_ui()
-
-    # Web Tools
-    elif category == "Web Tools":
-        tool = st.sidebar.selectbox(
-            "Select Tool:",
-            [
-                "Weather Alert",
-                "Browser History Journal"
-            ]
-        )
-
-        if tool == "Weather Alert":
-            weather_alert_ui()
-        elif tool == "Browser History Journal":
-            browser_history_ui()
-
-    # Data Tools
-    elif category == "Data Tools":
-        tool = st.sidebar.selectbox(
-            "Select Tool:",
-            ["Generate Meeting Notes"]
-        )
-
-        if tool == "Generate Meeting Notes":
-            meeting_notes_ui()
+    # Other categories: pick a tool, then render only that tool's UI
+    tools = TOOLS[category]
+    tool = st.sidebar.selectbox("Select Tool:", list(tools))
+    tools[tool]()
 
 
 # UI Functions for each tool
@@ -117,26 +226,15 @@ def articles_to_audio_ui():
     if st.button("Convert to Audio"):
         if url:
             try:
-                import importlib.util
-                spec = importlib.util.spec_from_file_location(
-                    "articles_pod",
-                    Path(__file__).parent / "Articles-pod.py"
-                )
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
-
                 with st.spinner("Converting article to audio..."):
-                    output_file = "article_output.mp3"
-                    module.article_to_audio(url, output_file)
-
-                if Path(output_file).exists():
-                    st.success("Audio created successfully!")
-                    with open(output_file, "rb") as f:
-                        st.download_button(
-                            "Download MP3",
-                            f,
-                            file_name="article.mp3"
-                        )
+                    mp3 = _article_mp3(url)
+
+                st.success("Audio created successfully!")
+                st.download_button(
+                    "Download MP3",
+                    mp3,
+                    file_name="article.mp3"
+                )
             except Exception as e:
                 st.error(f"Error: {e}")
         else:
@@ -153,11 +251,30 @@ def video_downloader_ui():
 
     if st.button("Download"):
         if url:
-            st.info("Download started... (this may take a while)")
-            st.warning("Note: Download happens in background. Check output directory.")
+            module = _load_tool("video_grab", str(Path(__file__).parent / "video grab.py"))
+
+            # The worker thread can't draw Streamlit elements, so its hook
+            # only records progress; the sidebar renders it on each rerun
+            progress = {"url": url, "fraction": 0.0}
+
+            def on_progress(d: dict) -> None:
+                if d["status"] == "downloading":
+                    total = d.get("total_bytes") or d.get("total_bytes_estimate")
+                    if total:
+                        progress["fraction"] = min(d["downloaded_bytes"] / total, 1.0)
+                elif d["status"] == "finished":
+                    progress["fraction"] = 1.0
+
+            future = _download_pool().submit(
+                module.download_video, url, ".", quality, audio_only, False, on_progress
+            )
+            st.session_state.setdefault("downloads", []).append((progress, future))
+            st.info("Download started in the background. Track it in the sidebar.")
         else:
             st.warning("Please enter a URL")
 
+    _show_downloads()
+
 
 def youtube_transcript_ui():
     st.header("📝 YouTube Transcript Downloader")
@@ -170,13 +287,7 @@ def youtube_transcript_ui():
     if st.button("Download Transcript"):
         if url:
             try:
-                import importlib.util
-                spec = importlib.util.spec_from_file_location(
-                    "yt_transcript",
-                    Path(__file__).parent / "YouTube Transcript.py"
-                )
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
+                module = _load_tool("yt_transcript", str(Path(__file__).parent / "YouTube Transcript.py"))
 
                 with st.spinner("Downloading transcript..."):
                     video_id = module.extract_video_id(url)
@@ -214,24 +325,17 @@ def qr_code_ui():
         if st.button("Generate QR Code"):
             if data:
                 try:
-                    import qrcode
-                    qr = qrcode.QRCode(version=1, box_size=size, border=4)
-                    qr.add_data(data)
-                    qr.make(fit=True)
-                    img = qr.make_image(fill_color="black", back_color="white")
-
-                    output_path = "qrcode_output.png"
-                    img.save(output_path)
+                    png = _make_qr_png(data, size)
 
                     st.success("QR code generated!")
-                    st.image(output_path)
-
-                    with open(output_path, "rb") as f:
-                        st.download_button(
-                            "Download QR Code",
-                            f,
-                            file_name="qrcode.png"
-                        )
+                    st.image(png)
+
+                    st.download_button(
+                        "Download QR Code",
+                        png,
+                        file_name="qrcode.png",
+                        mime="image/png"
+                    )
                 except Exception as e:
                     st.error(f"Error: {e}")
             else:
@@ -242,25 +346,24 @@ def qr_code_ui():
 
         if uploaded_file and st.button("Scan QR Code"):
             try:
-                from PIL import Image
-                try:
-                    from pyzbar.pyzbar import decode
-                    scanner = "pyzbar"
-                except:
-                    import cv2
-                    scanner = "opencv"
-
-                img = Image.open(uploaded_file)
+                scanner, backend = _qr_scanner()
 
+                # Decode straight from the upload's in-memory buffer
                 if scanner == "opencv":
                     import cv2
                     import numpy as np
-                    img_array = np.array(img)
-                    detector = cv2.QRCodeDetector()
-                    data, vertices, _ = detector.detectAndDecode(img_array)
+                    # OpenCV decodes the file itself, straight to the single
+                    # grayscale channel the detector works on
+                    img_array = cv2.imdecode(
+                        np.frombuffer(uploaded_file.getbuffer(), np.uint8),
+                        cv2.IMREAD_GRAYSCALE
+                    )
+                    data, vertices, _ = backend.detectAndDecode(img_array)
                     results = [data] if data else []
                 else:
-                    decoded_objects = decode(img)
+                    from PIL import Image
+                    img = Image.open(io.BytesIO(uploaded_file.getbuffer()))
+                    decoded_objects = backend(img)
                     results = [obj.data.decode("utf-8") for obj in decoded_objects]
 
                 if results:
@@ -292,32 +395,23 @@ def text_to_handwriting_ui():
     if st.button("Generate Handwriting"):
         if text:
             try:
-                import importlib.util
-                spec = importlib.util.spec_from_file_location(
-                    "text_handwriting",
-                    Path(__file__).parent / "Text to Handwriting.py"
-                )
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
+                module = _load_tool("text_handwriting", str(Path(__file__).parent / "Text to Handwriting.py"))
 
-                output_path = "handwriting_output.png"
                 ink_rgb = module.parse_color(ink_color)
                 paper_rgb = module.parse_color(paper_color)
-
-                module.create_handwriting_image(
-                    text, output_path, font_size, line_spacing,
-                    ink_rgb, paper_rgb
+                png = _render_handwriting(
+                    text, font_size, line_spacing, ink_rgb, paper_rgb
                 )
 
                 st.success("Handwriting generated!")
-                st.image(output_path)
+                st.image(png)
 
-                with open(output_path, "rb") as f:
-                    st.download_button(
-                        "Download Image",
-                        f,
-                        file_name="handwriting.png"
-                    )
+                st.download_button(
+                    "Download Image",
+                    png,
+                    file_name="handwriting.png",
+                    mime="image/png"
+                )
             except Exception as e:
                 st.error(f"Error: {e}")
         else:
@@ -335,19 +429,9 @@ def exif_editor_ui():
         if mode == "View EXIF":
             if st.button("View Metadata"):
                 try:
-                    import importlib.util
-                    spec = importlib.util.spec_from_file_location(
-                        "exif_editor",
-                        Path(__file__).parent / "EXIF Editor.py"
+                    exif_data = _read_exif_cached(
+                        _upload_digest(uploaded_file), uploaded_file
                     )
-                    module = importlib.util.module_from_spec(spec)
-                    spec.loader.exec_module(module)
-
-                    with tempfile.NamedTemporaryFile(delete=False, suffix=".jpg") as tmp:
-                        tmp.write(uploaded_file.getvalue())
-                        tmp_path = tmp.name
-
-                    exif_data = module.read_exif(tmp_path)
 
                     if exif_data:
                         st.success("EXIF data found:")
@@ -355,8 +439,6 @@ def exif_editor_ui():
                     else:
                         st.info("No EXIF data found")
 
-                    os.unlink(tmp_path)
-
                 except Exception as e:
                     st.error(f"Error: {e}")
 
@@ -373,27 +455,16 @@ def resume_parser_ui():
 
     if uploaded_file and st.button("Parse Resume"):
         try:
-            import importlib.util
-            spec = importlib.util.spec_from_file_location(
-                "resume_parser",
-                Path(__file__).parent / "Resume Parser.py"
-            )
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-
             suffix = ".pdf" if uploaded_file.name.endswith(".pdf") else ".docx"
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-                tmp.write(uploaded_file.getvalue())
-                tmp_path = tmp.name
 
             with st.spinner("Parsing resume..."):
-                resume_data = module.parse_resume(tmp_path)
+                resume_data = _parse_resume_cached(
+                    _upload_digest(uploaded_file), suffix, uploaded_file
+                )
 
             st.success("Resume parsed successfully!")
             st.json(resume_data)
 
-            os.unlink(tmp_path)
-
         except Exception as e:
             st.error(f"Error: {e}")
 
@@ -407,23 +478,10 @@ def markdown_table_ui():
 
     if uploaded_file and st.button("Generate Table"):
         try:
-            import importlib.util
-            spec = importlib.util.spec_from_file_location(
-                "md_table",
-                Path(__file__).parent / "Markdown Table Generator.py"
-            )
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
-
             suffix = Path(uploaded_file.name).suffix
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix, mode='wb') as tmp:
-                tmp.write(uploaded_file.getvalue())
-                tmp_path = tmp.name
-
-            if suffix == ".csv":
-                table = module.csv_to_markdown(tmp_path, alignment or None)
-            else:
-                table = module.json_to_markdown(tmp_path, alignment or None)
+            table = _markdown_table_cached(
+                _upload_digest(uploaded_file), suffix, alignment, uploaded_file
+            )
 
             st.success("Table generated!")
             st.code(table, language="markdown")
@@ -434,8 +492,6 @@ def markdown_table_ui():
                 file_name="table.md"
             )
 
-            os.unlink(tmp_path)
-
         except Exception as e:
             st.error(f"Error: {e}")
 
@@ -450,13 +506,7 @@ def weather_alert_ui():
     if st.button("Get Weather"):
         if city and api_key:
             try:
-                import importlib.util
-                spec = importlib.util.spec_from_file_location(
-                    "weather",
-                    Path(__file__).parent / "Weather Alert.py"
-                )
-                module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(module)
+                module = _load_tool("weather", str(Path(__file__).parent / "Weather Alert.py"))
 
                 with st.spinner("Fetching weather..."):
                     data = module.get_weather(city, api_key)
@@ -474,7 +524,7 @@ def weather_alert_ui():
 
                 if analysis['alerts']:
                     st.warning(f"{len(analysis['alerts'])} Alert(s):")
-                    for alert in analysis['alerts']:
+                    for alert in module.format_alerts(analysis):
                         st.write(f"- {alert}")
                 else:
                     st.info("No weather alerts")
@@ -578,8 +628,14 @@ def script_generator_ui():
                 # Get examples if requested
                 examples = get_example_scripts(2) if use_examples else None
 
-                # Generate
-                result = generate_script(description, examples)
+                # Generate, showing the code as it streams in
+                preview = st.empty()
+                result = generate_script(
+                    description,
+                    examples,
+                    on_text=lambda text: preview.code(text, language='python')
+                )
+                preview.empty()
 
                 # Store in session state
                 st.session_state['generated_script'] = result
@@ -672,5 +728,32 @@ def script_generator_ui():
                 st.rerun()
 
 
+
+# Tools per sidebar category, mapped to the function rendering their UI.
+# Only the picked tool's UI runs, and it loads its script and that script's
+# heavy dependencies (PIL, qrcode, pdfium, ...) itself
+TOOLS = {
+    "Content Tools": {
+        "Articles to Audio": articles_to_audio_ui,
+        "YouTube Video Downloader": video_downloader_ui,
+        "YouTube Transcript": youtube_transcript_ui,
+        "QR Code Tool": qr_code_ui,
+        "Text to Handwriting": text_to_handwriting_ui
+    },
+    "File Tools": {
+        "EXIF Editor": exif_editor_ui,
+        "Resume Parser": resume_parser_ui,
+        "Markdown Table Generator": markdown_table_ui
+    },
+    "Web Tools": {
+        "Weather Alert": weather_alert_ui,
+        "Browser History Journal": browser_history_ui
+    },
+    "Data Tools": {
+        "Generate Meeting Notes": meeting_notes_ui
+    }
+}
+
+
 if __name__ == "__main__":
     main()
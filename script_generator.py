@@ -1,12 +1,46 @@
 # ABOUTME: AI-powered script generator using Anthropic API
 # ABOUTME: Generates scripts following project patterns with CLI args, error handling, type hints
 
+import ast
 import os
 import re
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 from anthropic import Anthropic
 
+# Standard library modules to exclude from dependencies: the interpreter's
+# own list on Python 3.10+, plus a hand-kept set for older versions
+STDLIB_MODULES = frozenset(getattr(sys, "stdlib_module_names", ())) | {
+    'abc', 'argparse', 'asyncio', 'base64', 'collections', 'csv',
+    'datetime', 'email', 'functools', 'hashlib', 'http', 'io', 'itertools',
+    'json', 'logging', 'math', 'os', 'pathlib', 'random', 're', 'shutil',
+    'socket', 'sqlite3', 'string', 'subprocess', 'sys', 'tempfile',
+    'threading', 'time', 'typing', 'urllib', 'uuid', 'warnings', 'xml'
+}
+
+# Map common module names to package names
+PACKAGE_MAP = {
+    'PIL': 'Pillow',
+    'cv2': 'opencv-python',
+    'bs4': 'beautifulsoup4',
+    'docx': 'python-docx'
+}
+
+# Patterns used to post-process generated code, compiled once at import
+PYTHON_BLOCK_RE = re.compile(r'```python\n(.*?)```', re.DOTALL)
+CODE_BLOCK_RE = re.compile(r'```\n(.*?)```', re.DOTALL)
+IMPORT_RE = re.compile(r'(?:from|import)\s+([a-zA-Z0-9_]+)')
+ABOUTME_RE = re.compile(r'# ABOUTME: ([^\n]+)')
+WORD_RE = re.compile(r'\w+')
+# Maps every ASCII non-word character to a space, for regex-free tokenizing
+NON_WORD_TABLE = str.maketrans({
+    chr(i): ' ' for i in range(128) if not (chr(i).isalnum() or chr(i) == '_')
+})
+REQUIRED_ARG_RE = re.compile(r'add_argument\(["\']([^"\']+)["\'](?!.*(?:action|--)).*help=["\']([^"\']+)')
+OPTIONAL_ARG_RE = re.compile(r'add_argument\(["\'](-[^"\']+)["\'].*help=["\']([^"\']+)')
+
 
 SYSTEM_PROMPT = """You are an expert Python developer creating utility scripts for a collection.
 
@@ -64,13 +98,24 @@ Generate ONLY the complete Python code. No explanations, no markdown blocks.
 Start with the ABOUTME comments."""
 
 
-def generate_script_sync(description: str, example_scripts: List[str] = None) -> Dict:
+@lru_cache(maxsize=4)
+def get_client(api_key: str) -> Anthropic:
+    """Return a shared Anthropic client per API key, reusing its connection pool."""
+    return Anthropic(api_key=api_key)
+
+
+def generate_script_sync(
+    description: str,
+    example_scripts: List[str] = None,
+    on_text: Optional[Callable[[str], None]] = None
+) -> Dict:
     """
     Generate script using Anthropic API.
 
     Args:
         description: User description of desired script
         example_scripts: Optional list of existing scripts to use as examples
+        on_text: Optional callback given the text generated so far as it streams
 
     Returns:
         Dict with: code, filename, dependencies, usage
@@ -106,20 +151,24 @@ Start with # ABOUTME comments."""
     if not api_key:
         raise ValueError("ANTHROPIC_API_KEY not set")
 
-    client = Anthropic(api_key=api_key)
+    client = get_client(api_key)
 
-    # Generate code
-    response = client.messages.create(
+    # Stream the code, collecting chunks in a list and joining once
+    parts = []
+    with client.messages.stream(
         model="claude-sonnet-4-20250514",
         max_tokens=4096,
         system=SYSTEM_PROMPT,
         messages=[
             {"role": "user", "content": prompt}
         ]
-    )
+    ) as stream:
+        for text in stream.text_stream:
+            parts.append(text)
+            if on_text:
+                on_text("".join(parts))
 
-    # Extract text from response
-    generated_code = response.content[0].text
+    generated_code = "".join(parts)
 
     # Extract code (remove any markdown if present)
     code = extract_code(generated_code)
@@ -145,11 +194,11 @@ def extract_code(text: str) -> str:
     """Extract Python code from response, removing markdown if present."""
     # Remove markdown code blocks if present
     if "```python" in text:
-        match = re.search(r'```python\n(.*?)```', text, re.DOTALL)
+        match = PYTHON_BLOCK_RE.search(text)
         if match:
             return match.group(1).strip()
     elif "```" in text:
-        match = re.search(r'```\n(.*?)```', text, re.DOTALL)
+        match = CODE_BLOCK_RE.search(text)
         if match:
             return match.group(1).strip()
 
@@ -159,48 +208,43 @@ def extract_code(text: str) -> str:
 
 def extract_dependencies(code: str) -> List[str]:
     """Extract third-party dependencies from import statements."""
-    # Standard library modules to exclude
-    stdlib = {
-        'abc', 'argparse', 'asyncio', 'base64', 'collections', 'csv',
-        'datetime', 'email', 'functools', 'hashlib', 'http', 'io', 'itertools',
-        'json', 'logging', 'math', 'os', 'pathlib', 'random', 're', 'shutil',
-        'socket', 'sqlite3', 'string', 'subprocess', 'sys', 'tempfile',
-        'threading', 'time', 'typing', 'urllib', 'uuid', 'warnings', 'xml'
-    }
-
     dependencies = set()
 
-    # Find all imports
-    import_pattern = r'(?:from|import)\s+([a-zA-Z0-9_]+)'
-    matches = re.findall(import_pattern, code)
-
-    for module in matches:
+    # Find all top-level imported modules, skipping relative imports
+    try:
+        modules = set()
+        for node in ast.walk(ast.parse(code)):
+            if isinstance(node, ast.Import):
+                modules.update(alias.name.split('.')[0] for alias in node.names)
+            elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+                modules.add(node.module.split('.')[0])
+    except SyntaxError:
+        # Generated code that doesn't parse: fall back to a textual scan
+        modules = IMPORT_RE.findall(code)
+
+    for module in modules:
         # Skip standard library
-        if module not in stdlib:
-            # Map common module names to package names
-            package_map = {
-                'PIL': 'Pillow',
-                'cv2': 'opencv-python',
-                'bs4': 'beautifulsoup4',
-                'docx': 'python-docx'
-            }
-            package = package_map.get(module, module)
-            dependencies.add(package)
+        if module not in STDLIB_MODULES:
+            dependencies.add(PACKAGE_MAP.get(module, module))
 
-    return sorted(list(dependencies))
+    return sorted(dependencies)
 
 
 def generate_filename(description: str, code: str) -> str:
     """Generate appropriate filename from description."""
     # Try to extract from code if it has a clear name pattern
-    aboutme_match = re.search(r'# ABOUTME: ([^\n]+)', code)
+    aboutme_match = ABOUTME_RE.search(code)
     if aboutme_match:
         desc = aboutme_match.group(1).strip()
     else:
         desc = description
 
-    # Clean and title case
-    words = re.findall(r'\w+', desc)
+    # Clean and title case. ASCII text is tokenized with one C-level
+    # translate; other text keeps the regex for Unicode word rules
+    if desc.isascii():
+        words = desc.translate(NON_WORD_TABLE).split()
+    else:
+        words = WORD_RE.findall(desc)
     filename = ' '.join(words[:4]).title()  # Max 4 words
 
     return f"{filename}.py"
@@ -211,18 +255,42 @@ def generate_usage_instructions(filename: str, code: str) -> str:
     # Try to extract from argparse
     usage_lines = [f"python \"{filename}\""]
 
-    # Find required arguments
-    required_pattern = r'add_argument\(["\']([^"\']+)["\'](?!.*(?:action|--)).*help=["\']([^"\']+)'
-    required_args = re.findall(required_pattern, code)
+    # Find positional and optional arguments in one pass over the AST
+    try:
+        required_args = []
+        optional_args = []
+        for node in ast.walk(ast.parse(code)):
+            if not (isinstance(node, ast.Call)
+                    and getattr(node.func, 'attr', None) == 'add_argument'
+                    and node.args
+                    and isinstance(node.args[0], ast.Constant)
+                    and isinstance(node.args[0].value, str)):
+                continue
+
+            arg = node.args[0].value
+            help_text = next(
+                (kw.value.value for kw in node.keywords
+                 if kw.arg == 'help'
+                 and isinstance(kw.value, ast.Constant)
+                 and isinstance(kw.value.value, str)),
+                None
+            )
+            # Like the regex fallback, only report documented arguments
+            if help_text is None:
+                continue
+            if arg.startswith('-'):
+                optional_args.append((arg, help_text))
+            else:
+                required_args.append((arg, help_text))
+    except SyntaxError:
+        # Generated code that doesn't parse: fall back to a textual scan
+        required_args = REQUIRED_ARG_RE.findall(code)
+        optional_args = OPTIONAL_ARG_RE.findall(code)
 
     for arg, help_text in required_args:
         if not arg.startswith('-'):
             usage_lines[0] += f" <{arg}>"
 
-    # Find optional arguments
-    optional_pattern = r'add_argument\(["\'](-[^"\']+)["\'].*help=["\']([^"\']+)'
-    optional_args = re.findall(optional_pattern, code)
-
     usage = usage_lines[0]
 
     if optional_args:
@@ -233,22 +301,28 @@ def generate_usage_instructions(filename: str, code: str) -> str:
     return usage
 
 
-def generate_script(description: str, example_scripts: List[str] = None) -> Dict:
+def generate_script(
+    description: str,
+    example_scripts: List[str] = None,
+    on_text: Optional[Callable[[str], None]] = None
+) -> Dict:
     """
     Generate script using Anthropic API.
 
     Args:
         description: User description of desired script
         example_scripts: Optional list of existing scripts
+        on_text: Optional callback given the text generated so far as it streams
 
     Returns:
         Dict with: code, filename, dependencies, usage
     """
-    return generate_script_sync(description, example_scripts)
+    return generate_script_sync(description, example_scripts, on_text)
 
 
-def get_example_scripts(limit: int = 2) -> List[str]:
-    """Read existing scripts as examples."""
+@lru_cache(maxsize=4)
+def get_example_scripts(limit: int = 2) -> Tuple[str, ...]:
+    """Read existing scripts as examples, once per limit."""
     scripts_dir = Path(__file__).parent
     examples = []
 
@@ -268,4 +342,4 @@ def get_example_scripts(limit: int = 2) -> List[str]:
             except:
                 continue
 
-    return examples
+    return tuple(examples)
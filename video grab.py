@@ -4,7 +4,7 @@
 import argparse
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 import yt_dlp
 
 
@@ -13,7 +13,8 @@ def download_video(
     output_dir: str = ".",
     quality: str = "best",
     audio_only: bool = False,
-    playlist: bool = False
+    playlist: bool = False,
+    progress_hook: Optional[Callable[[dict], None]] = None
 ) -> None:
     """
     Download video from URL.
@@ -24,6 +25,8 @@ def download_video(
         quality: Video quality (best, 1080p, 720p, 480p)
         audio_only: Extract audio only
         playlist: Download entire playlist
+        progress_hook: Optional yt-dlp progress hook; replaces the console
+            progress bar when set
     """
     try:
         output_path = Path(output_dir)
@@ -51,6 +54,12 @@ def download_video(
             "ignoreerrors": False,
         }
 
+        if progress_hook:
+            # The caller reports progress itself, so keep yt-dlp quiet
+            opts["progress_hooks"] = [progress_hook]
+            opts["quiet"] = True
+            opts["no_warnings"] = True
+
         if audio_only:
             opts["postprocessors"] = [{
                 "key": "FFmpegExtractAudio",
@@ -67,7 +76,9 @@ def download_video(
             if "entries" in info and playlist:
                 print(f"[INFO] Found playlist with {len(info['entries'])} videos")
 
-            ydl.download([url])
+            # Download from the info already fetched instead of letting
+            # download() resolve the URL a second time
+            ydl.process_ie_result(info, download=True)
 
         print("[OK] Download completed")
 